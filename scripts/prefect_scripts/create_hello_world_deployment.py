@@ -1,11 +1,16 @@
+from deployments import DEPLOYMENTS, REPO_URL, WORK_POOL_NAME
 from prefect import flow
 
+# entrypoint and schedule live in deployments.DEPLOYMENTS
+DEPLOYMENT_NAME = "hello-world-deployment"
+
 if __name__ == "__main__":
+    entrypoint, cron = DEPLOYMENTS[DEPLOYMENT_NAME]
     flow.from_source(
-        source="https://github.com/AccelerationConsortium/ac-training-lab.git",
-        entrypoint="scripts/prefect_scripts/hello_world.py:hello_world",
+        source=REPO_URL,
+        entrypoint=entrypoint,
     ).deploy(
-        name="hello-world-deployment",
-        work_pool_name="my-managed-pool",
-        cron="0 1 * * *",  # Run every day at 1:00 AM
+        name=DEPLOYMENT_NAME,
+        work_pool_name=WORK_POOL_NAME,
+        cron=cron,
     )
@@ -1,11 +1,16 @@
+from deployments import DEPLOYMENTS, REPO_URL, WORK_POOL_NAME
 from prefect import flow
 
+# entrypoint and schedule live in deployments.DEPLOYMENTS
+DEPLOYMENT_NAME = "pause-workflow-deployment"
+
 if __name__ == "__main__":
+    entrypoint, cron = DEPLOYMENTS[DEPLOYMENT_NAME]
     flow.from_source(
-        source="https://github.com/AccelerationConsortium/ac-training-lab.git",
-        entrypoint="scripts/prefect_scripts/my_gh_pause_workflow.py:greet_user",
+        source=REPO_URL,
+        entrypoint=entrypoint,
     ).deploy(
-        name="pause-workflow-deployment",
-        work_pool_name="my-managed-pool",
-        cron="0 1 * * *",
+        name=DEPLOYMENT_NAME,
+        work_pool_name=WORK_POOL_NAME,
+        cron=cron,
     )
@@ -0,0 +1,31 @@
+"""Register every deployment in ``deployments.DEPLOYMENTS`` with one ``deploy`` call.
+
+Compared with running each ``create_*`` script in turn, this saves starting one
+Python process (and importing Prefect) per deployment, looks the work pool up
+once, and is a single command to run. Prefect still registers each deployment
+with its own API call, and each deployment still clones the repository.
+"""
+
+import sys
+
+from deployments import DEPLOYMENTS, REPO_URL, WORK_POOL_NAME
+from prefect import deploy, flow
+
+if __name__ == "__main__":
+    to_deploy = [
+        flow.from_source(source=REPO_URL, entrypoint=entrypoint).to_deployment(
+            name=name, cron=cron
+        )
+        for name, (entrypoint, cron) in DEPLOYMENTS.items()
+    ]
+
+    # managed pool pulls the code from git, so there is no image to build or push
+    deployment_ids = deploy(
+        *to_deploy, work_pool_name=WORK_POOL_NAME, build=False, push=False
+    )
+    print(f"Created {len(deployment_ids)} of {len(DEPLOYMENTS)} deployments")
+
+    # with several deployments, deploy() logs per-deployment failures and only
+    # returns the IDs that succeeded, so turn a partial failure into an error
+    if len(deployment_ids) != len(DEPLOYMENTS):
+        sys.exit(1)
@@ -0,0 +1,38 @@
+"""Shared settings for the deployment scripts in this directory.
+
+``DEPLOYMENTS`` is the source of truth for each deployment's entrypoint and
+schedule: ``deploy_all.py`` registers all of them, and each
+``create_*_deployment.py`` script registers one by name. Edit the table here
+rather than the individual scripts.
+"""
+
+REPO_URL = "https://github.com/AccelerationConsortium/ac-training-lab.git"
+WORK_POOL_NAME = "my-managed-pool"
+
+# deployment name -> (entrypoint, cron); cron=None means no schedule
+DEPLOYMENTS = {
+    "my-first-deployment": (
+        "scripts/prefect_scripts/my_gh_workflow.py:repo_info",
+        "0 1 * * *",  # Run every day at 1:00 AM
+    ),
+    "hello-world-deployment": (
+        "scripts/prefect_scripts/hello_world.py:hello_world",
+        "0 1 * * *",
+    ),
+    "pause-workflow-deployment": (
+        "scripts/prefect_scripts/my_gh_pause_workflow.py:greet_user",
+        "0 1 * * *",
+    ),
+    "pause-slack-workflow-deployment": (
+        "scripts/prefect_scripts/my_gh_pause_slack_workflow.py:greet_user",
+        "0 1 * * *",
+    ),
+    "sample-transfer-deployment": (
+        "scripts/prefect_scripts/my_gh_sample_transfer_workflow.py:move_sample",
+        None,
+    ),
+    "suspend-workflow-deployment": (
+        "scripts/prefect_scripts/my_gh_suspend_slack_workflow.py:greet_user",
+        None,
+    ),
+}
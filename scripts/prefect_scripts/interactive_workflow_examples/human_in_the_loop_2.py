@@ -52,9 +52,6 @@ class GuessingClassifier:
 # Initialize the classifier so it can be used by the flow.
 image_classifier = GuessingClassifier()
 
-# A Block we'll use to notify our humans that we need help
-slack_block = SlackWebhook.load("help-us-humans")
-
 
 @task
 async def classify(image) -> tuple[Animal, Confidence]:
@@ -85,6 +82,8 @@ async def classify_image(image_url: str = PUGLY):
             )
             message += f"\n\nAfter you view the image, open the <{flow_run_url}|paused flow run> and click Resume to classify the image."  # noqa: E501
 
+        # A Block we'll use to notify our humans that we need help
+        slack_block = await SlackWebhook.load("help-us-humans")
         await slack_block.notify(message)
 
         label = await pause_flow_run(wait_for_input=Animal, timeout=60)
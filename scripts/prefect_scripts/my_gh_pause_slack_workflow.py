@@ -10,8 +10,6 @@ from prefect import flow, get_run_logger, pause_flow_run, settings
 from prefect.blocks.notifications import SlackWebhook
 from prefect.context import get_run_context
 
-slack_block = SlackWebhook.load("prefect-test")
-
 MESSAGE = "This is an example of a human-in-the-loop flow using Prefect's interactive workflow features."  # noqa: E501
 
 
@@ -28,6 +26,7 @@ def greet_user():
         )
         message += f"\n\nOpen the <{flow_run_url}|paused flow run>, click 'Resume', and then submit your name."  # noqa: E501
 
+    slack_block = SlackWebhook.load("prefect-test")
     slack_block.notify(message)
     user = pause_flow_run(wait_for_input=str, timeout=60)
 
@@ -4,12 +4,15 @@
 
 import asyncio
 
-from prefect import flow, get_run_logger, pause_flow_run, settings
+from prefect import flow, get_run_logger, settings
 from prefect.blocks.notifications import SlackWebhook
 from prefect.context import get_run_context
 from prefect.input import RunInput
 
-slack_block = SlackWebhook.load("prefect-test")
+try:  # native coroutine on newer Prefect, skips the sync/async dispatch shim
+    from prefect.flow_runs import apause_flow_run
+except ImportError:
+    from prefect.flow_runs import pause_flow_run as apause_flow_run
 
 
 class UserInput(RunInput):
@@ -39,8 +42,9 @@ async def move_sample(
         )
         message += f"\n\nOpen the <{flow_run_url}|paused flow run>, click 'Resume ▶️', and follow the instructions."  # noqa: E501
 
+    slack_block = await SlackWebhook.load("prefect-test")
     await slack_block.notify(message)
-    user_input = await pause_flow_run(
+    user_input = await apause_flow_run(
         wait_for_input=UserInput.with_initial_data(
             description="Please provide your GitHub username, any comments, and whether this sample transfer should be flagged for review.",  # noqa: E501
             # github_username="sgbaird",
@@ -6,8 +6,6 @@ from prefect import flow, get_run_logger, settings, suspend_flow_run
 from prefect.blocks.notifications import SlackWebhook
 from prefect.context import get_run_context
 
-slack_block = SlackWebhook.load("prefect-test")
-
 MESSAGE = "This is an example of a human-in-the-loop flow using Prefect's interactive workflow features."  # noqa: E501
 
 
@@ -24,6 +22,7 @@ async def greet_user():
         )
         message += f"\n\nOpen the <{flow_run_url}|paused flow run>, click 'Resume', and then submit your name."  # noqa: E501
 
+    slack_block = await SlackWebhook.load("prefect-test")
     await slack_block.notify(message)
     user = await suspend_flow_run(wait_for_input=str, timeout=120)
 
@@ -177,7 +177,7 @@ def handle_query_coords(args, cobot):
 
 
 def handle_query_gripper(args, cobot):
-    logger.info(f"running command query/coord with {args}")
+    logger.info(f"running command query/gripper with {args}")
     try:
         gripper_pos = cobot.get_gripper_value()
         return {"success": True, "position": gripper_pos}
@@ -2,10 +2,11 @@
 
 import os
 from datetime import datetime
+from functools import lru_cache
 
 import pandas as pd
 from prefect import task
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 
 MONGODB_PASSWORD = os.getenv("MONGODB_PASSWORD")
 
@@ -14,47 +15,60 @@ blinded_connection_string = os.getenv("blinded_connection_string")
 connection_string = blinded_connection_string.replace("<db_password>", MONGODB_PASSWORD)
 
 
+@lru_cache(maxsize=1)
+def get_dbclient():
+    # MongoClient manages its own connection pool, so share one per process rather
+    # than reconnecting (and re-handshaking) on every call
+    return MongoClient(connection_string)
+
+
+def ensure_indexes():
+    # the helpers below look wells up by name and students by ID; run once at setup
+    # (create_index is a no-op when the index already exists)
+    dbclient = get_dbclient()
+    db = dbclient["LCM-OT-2-SLD"]
+    db["wells"].create_index("well")
+    db["student"].create_index("student_id")
+
+
 @task
 def generate_empty_well():
-    dbclient = MongoClient(connection_string)
+    dbclient = get_dbclient()
     db = dbclient["LCM-OT-2-SLD"]
     collection = db["wells"]
     rows = ["A", "B", "C", "D", "E", "F", "G", "H"]
     columns = [str(i) for i in range(1, 13)]
+    # upsert the whole plate in one round trip instead of one update per well
+    requests = []
     for row in rows:
         for col in columns:
             well = f"{row}{col}"
             metadata = {"well": well, "status": "empty", "project": "OT2"}
-
-            # send_data_to_mongodb(collection="wells", data=metadata)
-            query = {"well": well}
-            update_data = {"$set": metadata}
-            collection.update_one(query, update_data, upsert=True)
-
-    # close connection
-    dbclient.close()
+            requests.append(UpdateOne({"well": well}, {"$set": metadata}, upsert=True))
+    collection.bulk_write(requests, ordered=False)
 
 
 @task
 def update_used_wells(used_wells):
-    dbclient = MongoClient(connection_string)
+    dbclient = get_dbclient()
     db = dbclient["LCM-OT-2-SLD"]
     collection = db["wells"]
 
+    # send all status changes in one round trip; bulk_write rejects an empty batch
+    requests = []
     for well in used_wells:
         metadata = {"well": well, "status": "used", "project": "OT2"}
         # send_data_to_mongodb(collection="wells", data=metadata)
         query = {"well": well}
         update_data = {"$set": metadata}
-        collection.update_one(query, update_data, upsert=True)
-
-    # close connection
-    dbclient.close()
+        requests.append(UpdateOne(query, update_data, upsert=True))
+    if requests:
+        collection.bulk_write(requests, ordered=False)
 
 
 @task
 def find_unused_wells():
-    dbclient = MongoClient(connection_string)
+    dbclient = get_dbclient()
     db = dbclient["LCM-OT-2-SLD"]
     collection = db["wells"]
     query = {"status": "empty"}
@@ -74,9 +88,6 @@ def find_unused_wells():
     empty_wells = sorted(df["well"].tolist(), key=well_sort_key)
     # print(empty_wells)
 
-    # close connection
-    dbclient.close()
-
     # Check if there are any empty wells
     if len(empty_wells) == 0:
         raise ValueError("No empty wells found")
@@ -86,30 +97,28 @@ def find_unused_wells():
 
 @task
 def save_result(result_data):
-    dbclient = MongoClient(connection_string)
+    dbclient = get_dbclient()
     db = dbclient["LCM-OT-2-SLD"]
     collection = db["MSE403_result"]  # change collection afte this practical finishes
     # collection = db["test_result"]
     result_data["timestamp"] = datetime.utcnow()  # UTC time
     insert_result = collection.insert_one(result_data)
     inserted_id = insert_result.inserted_id
-    # close connection
-    dbclient.close()
     return inserted_id
 
 
 def get_student_quota(student_id):
-    with MongoClient(connection_string) as client:
-        db = client["LCM-OT-2-SLD"]
-        collection = db["student"]
-        student = collection.find_one({"student_id": student_id})
-        if student is None:
-            raise ValueError(f"Student ID '{student_id}' not found in the database.")
-        return student.get("quota", 0)
+    dbclient = get_dbclient()
+    db = dbclient["LCM-OT-2-SLD"]
+    collection = db["student"]
+    student = collection.find_one({"student_id": student_id})
+    if student is None:
+        raise ValueError(f"Student ID '{student_id}' not found in the database.")
+    return student.get("quota", 0)
 
 
 def decrement_student_quota(student_id):
-    dbclient = MongoClient(connection_string)
+    dbclient = get_dbclient()
     db = dbclient["LCM-OT-2-SLD"]
     collection = db["student"]
 
@@ -135,17 +144,17 @@ def add_student_quota(student_id, quota):
     :param student_id: The ID of the student.
     :param quota: The initial quota for the student.
     """
-    dbclient = MongoClient(connection_string)
+    dbclient = get_dbclient()
     db = dbclient["LCM-OT-2-SLD"]
     collection = db["student"]
     student_data = {"student_id": student_id, "quota": quota}
     collection.update_one(
         {"student_id": student_id}, {"$set": student_data}, upsert=True
     )
-    dbclient.close()
 
 
 if __name__ == "__main__":
+    ensure_indexes()
     generate_empty_well()
     # find_unused_wells()
     # test_id = "test"
@@ -1,9 +1,10 @@
 # Locally used well status management script, funtions same as in DB_utls.py
 import os
+from functools import lru_cache
 
 import pandas as pd
 from prefect import task
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 
 MONGODB_PASSWORD = os.getenv("MONGODB_PASSWORD")
 
@@ -12,49 +13,53 @@ blinded_connection_string = os.getenv("blinded_connection_string")
 connection_string = blinded_connection_string.replace("<db_password>", MONGODB_PASSWORD)
 
 
+@lru_cache(maxsize=1)
+def get_dbclient():
+    # MongoClient manages its own connection pool, so share one per process rather
+    # than reconnecting (and re-handshaking) on every call
+    return MongoClient(connection_string)
+
+
 @task
 def generate_empty_well():
-    dbclient = MongoClient(connection_string)
+    dbclient = get_dbclient()
     db = dbclient["LCM-OT-2-SLD"]
     collection = db["wells"]
     rows = ["B", "C", "D", "E", "F", "G", "H"]
     # rows = ['A', 'C', 'E','G']
     columns = [str(i) for i in range(1, 13)]
     # columns = [str(i) for i in [1,3,5]]
+    # upsert the whole plate in one round trip instead of one update per well
+    requests = []
     for row in rows:
         for col in columns:
             well = f"{row}{col}"
             metadata = {"well": well, "status": "empty", "project": "OT2"}
-
-            # send_data_to_mongodb(collection="wells", data=metadata)
-            query = {"well": well}
-            update_data = {"$set": metadata}
-            collection.update_one(query, update_data, upsert=True)
-
-    # close connection
-    dbclient.close()
+            requests.append(UpdateOne({"well": well}, {"$set": metadata}, upsert=True))
+    collection.bulk_write(requests, ordered=False)
 
 
 @task
 def update_used_wells(used_wells):
-    dbclient = MongoClient(connection_string)
+    dbclient = get_dbclient()
     db = dbclient["LCM-OT-2-SLD"]
     collection = db["wells"]
 
+    # send all status changes in one round trip; bulk_write rejects an empty batch
+    requests = []
     for well in used_wells:
         metadata = {"well": well, "status": "used", "project": "OT2"}
         # send_data_to_mongodb(collection="wells", data=metadata)
         query = {"well": well}
         update_data = {"$set": metadata}
-        collection.update_one(query, update_data, upsert=True)
-
-    # close connection
-    dbclient.close()
+        requests.append(UpdateOne(query, update_data, upsert=True))
+    if requests:
+        collection.bulk_write(requests, ordered=False)
 
 
 @task
 def find_unused_wells():
-    dbclient = MongoClient(connection_string)
+    dbclient = get_dbclient()
     db = dbclient["LCM-OT-2-SLD"]
     collection = db["wells"]
     query = {"status": "empty"}
@@ -74,9 +79,6 @@ def find_unused_wells():
     empty_wells = sorted(df["well"].tolist(), key=well_sort_key)
     # print(empty_wells)
 
-    # close connection
-    dbclient.close()
-
     # Check if there are any empty wells
     if len(empty_wells) == 0:
         raise ValueError("No empty wells found")
@@ -2,6 +2,7 @@ import json
 import os
 import shutil
 import subprocess
+import tempfile
 import time
 import webbrowser
 from pathlib import Path
@@ -40,11 +41,34 @@ TOKEN_CACHE_PATH = Path.home() / ".config" / "ac-picam" / "token.json"
 STREAM_STATE_PATH = Path.home() / ".config" / "ac-picam" / "stream.json"
 
 
+def _write_json_atomic(path, data):
+    # write to a sibling temp file and swap it in, so a crash mid-write never
+    # leaves a truncated cache file behind
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # mkstemp gives a unique name, so two writers (or a stale leftover from a
+    # crash) can never clobber each other's temp file
+    fd, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(data) + "\n")
+            f.flush()
+            # only the data (and size) must hit disk before the rename; skip the
+            # extra inode metadata flush where fdatasync is available
+            getattr(os, "fdatasync", os.fsync)(f.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+
+
 def load_cached_token():
     if LAMBDA_TOKEN:
         return LAMBDA_TOKEN
-    if not TOKEN_CACHE_PATH.exists():
-        return None
     try:
         data = json.loads(TOKEN_CACHE_PATH.read_text())
     except (OSError, json.JSONDecodeError):
@@ -53,13 +77,10 @@ def load_cached_token():
 
 
 def save_cached_token(token):
-    TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    TOKEN_CACHE_PATH.write_text(json.dumps({"token": token}) + "\n")
+    _write_json_atomic(TOKEN_CACHE_PATH, {"token": token})
 
 
 def load_cached_stream_id():
-    if not STREAM_STATE_PATH.exists():
-        return None
     try:
         data = json.loads(STREAM_STATE_PATH.read_text())
     except (OSError, json.JSONDecodeError):
@@ -70,8 +91,7 @@ def load_cached_stream_id():
 def save_cached_stream_id(stream_id):
     if not stream_id:
         return
-    STREAM_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    STREAM_STATE_PATH.write_text(json.dumps({"stream_id": stream_id}) + "\n")
+    _write_json_atomic(STREAM_STATE_PATH, {"stream_id": stream_id})
 
 
 def login_for_lambda_token():
@@ -6,6 +6,7 @@ import numpy as np
 import serial
 
 averaging_window = 5  # Number of data points to include in the moving average
+line_pattern = re.compile(r"X: (.*) uT, Y: (.*) uT, Z: (.*) uT")
 
 try:
     with serial.Serial("COM14", 9600, timeout=1) as ser:
@@ -31,7 +32,7 @@ try:
                 if not line:
                     continue
 
-                match = re.match(r"X: (.*) uT, Y: (.*) uT, Z: (.*) uT", line)
+                match = line_pattern.match(line)
                 if match:
                     magx, magy, magz = map(float, match.groups())
 
@@ -1,14 +1,22 @@
+import sys
 import time
+from functools import lru_cache
 
 from gradio_client import Client
-from prefect import flow, task
+from prefect import deploy, flow, task
 from prefect.flow_runs import pause_flow_run
 
 GRADIO_ENDPOINT = "AccelerationConsortium/PioReactor_gradio"  # Hardcoded endpoint
 
 
+@lru_cache(maxsize=1)
+def get_gradio_client():
+    # Creating a Client fetches the Space's API config, so connect once per process
+    return Client(GRADIO_ENDPOINT)
+
+
 def get_status():
-    client = Client(GRADIO_ENDPOINT)
+    client = get_gradio_client()
     result = client.predict(
         exp="Hello!!", api_name="/get_status_default"  # Replace with actual experiment
     )
@@ -17,7 +25,7 @@ def get_status():
 
 @task
 def start_stirring(rpm: int, experiment: str):
-    client = Client(GRADIO_ENDPOINT)
+    client = get_gradio_client()
     result = client.predict(
         rpm=rpm, experiment=experiment, state="start", api_name="/stirring_default"
     )
@@ -26,7 +34,7 @@ def start_stirring(rpm: int, experiment: str):
 
 @task
 def stop_stirring(experiment: str):
-    client = Client(GRADIO_ENDPOINT)
+    client = get_gradio_client()
     result = client.predict(
         rpm=0, experiment=experiment, state="stop", api_name="/stirring_default"
     )
@@ -35,7 +43,7 @@ def stop_stirring(experiment: str):
 
 @task
 def update_stirring(rpm: int, experiment: str):
-    client = Client(GRADIO_ENDPOINT)
+    client = get_gradio_client()
     result = client.predict(
         rpm=rpm, experiment=experiment, state="update", api_name="/stirring_default"
     )
@@ -80,36 +88,27 @@ def user_stop_stirring():
 
 if __name__ == "__main__":
     # stirring_control()
-    stirring_control.deploy(
-        name="Stop Stirring",
-        work_pool_name="docker-pool",
-        parameters={"stop": True},
-        image="edisonlinx5o/gradio_client:latest",
-        push=False,
-    )
-    stirring_control.deploy(
-        name="Start Stirring",
-        work_pool_name="docker-pool",
-        parameters={"start": True},
-        image="edisonlinx5o/gradio_client:latest",
-        push=False,
-    )
-    stirring_control.deploy(
-        name="Stirring Control",
-        work_pool_name="docker-pool",
-        parameters={"update": True, "rpm": 500},
-        image="edisonlinx5o/gradio_client:latest",
-        push=False,
-    )
-    intermediary_flow.deploy(
-        name="Stirring Control Flow",
-        work_pool_name="docker-pool",
-        image="edisonlinx5o/gradio_client:latest",
-        push=False,
-    )
-    user_stop_stirring.deploy(
-        name="User Controlled Stirring",
+    # Build the image once and register every deployment against it, rather than
+    # rebuilding it in a separate .deploy() call per deployment
+    deployments = [
+        stirring_control.to_deployment(name="Stop Stirring", parameters={"stop": True}),
+        stirring_control.to_deployment(
+            name="Start Stirring", parameters={"start": True}
+        ),
+        stirring_control.to_deployment(
+            name="Stirring Control", parameters={"update": True, "rpm": 500}
+        ),
+        intermediary_flow.to_deployment(name="Stirring Control Flow"),
+        user_stop_stirring.to_deployment(name="User Controlled Stirring"),
+    ]
+    deployment_ids = deploy(
+        *deployments,
         work_pool_name="docker-pool",
         image="edisonlinx5o/gradio_client:latest",
         push=False,
     )
+
+    # with several deployments, deploy() logs per-deployment failures and only
+    # returns the IDs that succeeded, so turn a partial failure into an error
+    if len(deployment_ids) != len(deployments):
+        sys.exit(1)